@@ -1,5 +1,5 @@
 import numpy as np
-from copy import deepcopy
+from copy import copy, deepcopy
 from typing import Union, Optional, List, Sequence
 from autode.log import logger
 from autode.geom import get_rot_mat_euler
@@ -408,17 +408,15 @@ class Atom:
                     if no origin is specified then the atom
                     is rotated without translation.
         """
-        # If specified, shift so that the origin is at (0, 0, 0)
-        if origin is not None:
-            self.translate(vec=-np.asarray(origin))
-
-        # apply the rotation
         rot_matrix = get_rot_mat_euler(axis=axis, theta=theta)
-        self.coord = np.matmul(rot_matrix, self.coord)
 
-        # and shift back, if required
-        if origin is not None:
-            self.translate(vec=np.asarray(origin))
+        if origin is None:
+            self.coord = np.matmul(rot_matrix, self.coord)
+
+        else:
+            # Shift so the origin is at (0, 0, 0), rotate and shift back
+            origin = np.asarray(origin)
+            self.coord = np.matmul(rot_matrix, self.coord - origin) + origin
 
         return None
 
@@ -655,6 +653,35 @@ class Atoms(list):
         return True
 
 
+def atoms_with_coordinates(atoms, coordinates):
+    """
+    Shallow copy a set of atoms, setting new coordinates for each one. Much
+    cheaper than a deepcopy, as only the coordinates need to differ. Atoms
+    with any other (possibly mutable) attributes e.g. SMILESAtoms are deep
+    copied
+
+    Arguments:
+        atoms (list(autode.atoms.Atom)):
+        coordinates (np.ndarray): shape = (len(atoms), 3)
+
+    Returns:
+        (autode.atoms.Atoms)
+    """
+    assert len(atoms) == len(coordinates)
+    new_atoms = Atoms()
+
+    for atom, coord in zip(atoms, coordinates):
+        if vars(atom).keys() <= {'label', '_coord'}:
+            new_atom = copy(atom)
+        else:
+            new_atom = deepcopy(atom)
+
+        new_atom.coord = coord
+        new_atoms.append(new_atom)
+
+    return new_atoms
+
+
 class AtomCollection:
 
     @property
@@ -8,6 +8,7 @@ from autode.conformers import Conformer
 import autode.exceptions as ex
 from autode.utils import log_time
 from autode.bonds import get_ideal_bond_length_matrix
+from autode.geom import get_rot_mat_euler
 from autode.input_output import xyz_file_to_atoms, atoms_to_xyz_file
 from autode.mol_graphs import split_mol_across_bond
 from autode.log import logger
@@ -156,11 +157,17 @@ def get_atoms_rotated_stereocentres(species, atoms, rand):
         idxs_to_rotate = left_idxs if i in left_idxs else right_idxs
 
         # Rotate all the atoms to the left of this bond, missing out i as that
-        # is the origin for rotation and thus won't move
-        for n in idxs_to_rotate:
-            if n == i:
-                continue
-            atoms[n].rotate(axis=rot_axis, theta=theta, origin=atoms[i].coord)
+        # is the origin for rotation and thus won't move. Applied as a single
+        # transform x' = R(x - o) + o for all the atoms
+        idxs = [n for n in idxs_to_rotate if n != i]
+        origin = np.array(atoms[i].coord, copy=True)
+        rot_matrix = get_rot_mat_euler(axis=rot_axis, theta=theta)
+
+        coords = np.array([atoms[n].coord for n in idxs]).reshape(-1, 3)
+        coords = np.dot(coords - origin, rot_matrix.T) + origin
+
+        for n, coord in zip(idxs, coords):
+            atoms[n].coord = coord
 
     return atoms
 
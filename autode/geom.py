@@ -1,4 +1,5 @@
 import numpy as np
+from functools import lru_cache
 from scipy.spatial.distance import cdist
 from scipy.spatial import distance_matrix
 from autode.log import logger
@@ -279,6 +280,18 @@ def get_points_on_sphere(n_points, r=1):
     Returns:
         (list(np.ndarray))
     """
+    return list(_points_on_sphere(n_points, r))
+
+
+@lru_cache(maxsize=16)
+def _points_on_sphere(n_points, r):
+    """
+    Cached points on a sphere, see get_points_on_sphere. The array is
+    read-only, as it is shared between all calls with the same arguments
+
+    Returns:
+        (np.ndarray): shape = (n, 3)
+    """
     points = []
 
     a = 4.0 * np.pi * r**2 / n_points
@@ -299,6 +312,9 @@ def get_points_on_sphere(n_points, r=1):
 
             points.append(point)
 
+    points = np.array(points, dtype='f8').reshape(-1, 3)
+    points.flags.writeable = False
+
     return points
 
 
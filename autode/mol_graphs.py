@@ -447,6 +447,31 @@ def is_isomorphic(graph1, graph2, ignore_active_bonds=False):
     return gm.is_isomorphic()
 
 
+def get_graph_hash(graph):
+    """
+    Weisfeiler-Lehman hash of a graph, using the same atom label and active
+    edge attributes as is_isomorphic. Graphs that are isomorphic have the same
+    hash, but graphs with the same hash are not necessarily isomorphic
+
+    Arguments:
+        graph (nx.Graph):
+
+    Returns:
+        (str): Hash
+    """
+    h_graph = nx.Graph()
+
+    for i, data in graph.nodes(data=True):
+        h_graph.add_node(i, atom_label=str(data.get('atom_label', 'C')))
+
+    for i, j, data in graph.edges(data=True):
+        h_graph.add_edge(i, j, active=str(data.get('active', False)))
+
+    return nx.weisfeiler_lehman_graph_hash(h_graph,
+                                          node_attr='atom_label',
+                                          edge_attr='active')
+
+
 def gm_is_isomorphic(gm, result):
     result[0] = gm.is_isomorphic()
 
@@ -1,25 +1,24 @@
-from copy import deepcopy
 import numpy as np
 from typing import Optional, Union, List, Sequence
-from autode.atoms import Atom, Atoms
+from autode.atoms import Atom, Atoms, atoms_with_coordinates
 from itertools import product as iterprod
-from scipy.spatial import distance_matrix
 from autode.log import logger
-from autode.geom import get_points_on_sphere
+from autode.geom import get_points_on_sphere, get_rot_mat_euler
 from autode.solvent.solvents import get_solvent
 from autode.mol_graphs import union
 from autode.species.species import Species
-from autode.utils import requires_atoms, work_in
+from autode.utils import requires_atoms, work_in, pairwise_sqeuclidean
 from autode.config import Config
 from autode.methods import get_lmethod
 from autode.conformers import Conformer
 from autode.exceptions import MethodUnavailable
 
 
-def get_complex_conformer_atoms(molecules, rotations, points):
+def get_complex_conformers_atoms(molecules, rotations, points, final_points):
     """
-    Generate a conformer of a complex given a set of molecules, rotations for
-    each and points on which to shift
+    Generate conformers of a complex which are identical apart from the point
+    on which the final molecule is added. All the final points are evaluated
+    at once
 
     Arguments:
         molecules (list(autode.species.Species)):
@@ -27,59 +26,108 @@ def get_complex_conformer_atoms(molecules, rotations, points):
                   [theta, x, y, z] defining the rotation
                                       amount and axis
         points: (list(np.ndarray)): List of length 3 np arrays containing the
-        point to add the molecule with index i
+        point to add the molecule with index i, for all but the final molecule
+
+        final_points (list(np.ndarray) | np.ndarray): Points on which to add
+                                                      the final molecule
 
     Returns:
-        (list(autode.atoms.Atom))
+        (list(list(autode.atoms.Atom))): Atoms for each final point
     """
-    assert len(molecules) - 1 == len(rotations) == len(points) > 0
+    assert len(molecules) - 1 == len(rotations) == len(points) + 1 > 0
 
-    # First molecule is static so start with those atoms
-    atoms = deepcopy(molecules[0].atoms)
+    # First molecule is static so start with those coordinates
+    coords = np.array(molecules[0].coordinates, dtype='f8')
 
     # For each molecule add it to the current set of atoms with the centroid
     # ~ COM located at the origin
     for i, molecule in enumerate(molecules[1:]):
 
-        centroid = np.average(np.array([atom.coord for atom in atoms]), axis=0)
-
         # Shift to the origin and rotate randomly, by the same amount
         theta, axis = np.random.uniform(-np.pi, np.pi), np.random.uniform(-1, 1, size=3)
-        for atom in atoms:
-            atom.translate(vec=-centroid)
-            atom.rotate(axis, theta)
-
-        coords = np.array([atom.coord for atom in atoms])
-
-        mol_centroid = np.average(molecule.coordinates, axis=0)
-        shifted_mol_atoms = deepcopy(molecule.atoms)
+        rot_matrix = get_rot_mat_euler(axis=axis, theta=theta)
+        coords = np.dot(coords - coords.mean(axis=0), rot_matrix.T)
 
         # Shift the molecule to the origin then rotate randomly
         theta, axis = rotations[i][0], rotations[i][1:]
-        for atom in shifted_mol_atoms:
-            atom.translate(vec=-mol_centroid)
-            atom.rotate(axis, theta)
+        rot_matrix = get_rot_mat_euler(axis=axis, theta=theta)
+        mol_coords = np.array(molecule.coordinates, dtype='f8')
+        mol_coords = np.dot(mol_coords - mol_coords.mean(axis=0),
+                            rot_matrix.T)
+
+        if i == len(points):
+            break     # Final molecule is added below, at all the final points
+
+        # Shift the molecule in the direction of the point (which has length
+        # 1) so the minimum distance to the rest of the complex is 2.0 Å
+        mol_coords += get_shift_distance(coords, mol_coords,
+                                         direction=points[i]) * points[i]
+
+        coords = np.concatenate((coords, mol_coords))
+
+    final_points = np.array(final_points, dtype='f8').reshape(-1, 3)
+    shifts = get_shift_distance(coords, mol_coords, direction=final_points)
+
+    atoms = sum((mol.atoms for mol in molecules), None)
+    conformers_atoms = []
+
+    for shift, point in zip(shifts, final_points):
+        conf_coords = np.concatenate((coords, mol_coords + shift * point))
+        conformers_atoms.append(atoms_with_coordinates(atoms, conf_coords))
+
+    return conformers_atoms
 
-        # Shift until the current molecules don't overlap with the current
-        #  atoms, i.e. aren't far enough apart
-        far_enough_apart = False
 
-        # Shift the molecule by 0.1 Å in the direction of the point
-        # (which has length 1) until the
-        # minimum distance to the rest of the complex is 2.0 Å
-        while not far_enough_apart:
+def get_shift_distance(coords, mol_coords, direction, min_dist=2.0):
+    """
+    Distance a molecule needs to be shifted along a direction so the minimum
+    distance to a set of other coordinates is min_dist. For a pair of atoms
+    separated by a vector d a shift t along the unit vector u gives a distance
+    of min_dist when::
+
+        t² - 2(d·u)t + |d|² - min_dist² = 0
+
+    so the required shift is the largest real root over all pairs. If there
+    are no real roots then the molecule does not overlap along u.
 
-            for atom in shifted_mol_atoms:
-                atom.coord += points[i] * 0.1
+    Arguments:
+        coords (np.ndarray): Coordinates to shift away from. shape = (n, 3)
+        mol_coords (np.ndarray): Coordinates of the molecule. shape = (m, 3)
+        direction (np.ndarray): Unit vector to shift along. shape = (3,), or
+                                a set of unit vectors with shape = (k, 3)
 
-            mol_coords = np.array([atom.coord for atom in shifted_mol_atoms])
+    Keyword Arguments:
+        min_dist (float): Minimum distance (Å)
 
-            if np.min(distance_matrix(coords, mol_coords)) > 2.0:
-                far_enough_apart = True
+    Returns:
+        (float | np.ndarray): Shift distance, which is not negative. One for
+                              each direction if more than one is given
+    """
+    # Single precision is plenty for a minimum distance, which halves the
+    # memory required for the k x n x m intermediate arrays
+    coords = np.ascontiguousarray(coords, dtype='f4')
+    mol_coords = np.ascontiguousarray(mol_coords, dtype='f4')
+    directions = np.asarray(direction, dtype='f4').reshape(-1, 3)
 
-        atoms += shifted_mol_atoms
+    # |d|² = |c|² + |m|² - 2c·m, which is independent of the direction. cdist
+    # only operates in double precision
+    sq_dists = np.dot(coords, -2.0 * mol_coords.T)
+    sq_dists += np.einsum('ij,ij->i', coords, coords)[:, None]
+    sq_dists += np.einsum('ij,ij->i', mol_coords, mol_coords)[None, :]
 
-    return atoms
+    # d·u = c·u - m·u, so only the projections of each set are required
+    d_dot_u = (np.dot(directions, coords.T)[:, :, None]
+               - np.dot(directions, mol_coords.T)[:, None, :])
+
+    discriminant = d_dot_u**2 - sq_dists + min_dist**2
+    is_real = discriminant >= 0
+
+    roots = np.where(is_real,
+                     d_dot_u + np.sqrt(np.maximum(discriminant, 0.0)),
+                     0.0)
+    shifts = np.maximum(roots.max(axis=(1, 2)), 0.0).astype('f8')
+
+    return float(shifts[0]) if np.ndim(direction) == 1 else shifts
 
 
 class Complex(Species):
@@ -94,6 +142,7 @@ class Complex(Species):
         if value is None:
             self.graph = None
             self._molecules = []
+            self._mol_offsets = np.zeros(1, dtype=int)
 
         elif self.n_atoms != len(value):
             raise ValueError(f'Cannot set atoms in {self.name} with a '
@@ -110,21 +159,22 @@ class Complex(Species):
         return len(self._molecules)
 
     def atom_indexes(self,
-                     mol_index: int):
+                     mol_index: int) -> range:
         """
-        List of atom indexes of a molecule withibn a Complex
+        Atom indexes of a molecule within a Complex
 
         Arguments:
             mol_index (int): Index of the molecule
+
+        Returns:
+            (range): Indexes
         """
-        if mol_index not in set(range(self.n_molecules)):
+        if mol_index not in range(self.n_molecules):
             raise AssertionError(f'Could not get idxs for molecule {mol_index}'
                                  f'. Not present in this complex')
 
-        first_index = sum([mol.n_atoms for mol in self._molecules[:mol_index]])
-        last_index = sum([mol.n_atoms for mol in self._molecules[:mol_index + 1]])
-
-        return list(range(first_index, last_index))
+        return range(int(self._mol_offsets[mol_index]),
+                     int(self._mol_offsets[mol_index + 1]))
 
     def reorder_atoms(self,
                       mapping: dict) -> None:
@@ -156,31 +206,54 @@ class Complex(Species):
             return None
 
         self.conformers = []
-        m = 0                                        # Current conformer number
 
-        points_on_sphere = get_points_on_sphere(n_points=Config.num_complex_sphere_points)
+        # Generate the conformers in sets which share the same rotations,
+        # up to the maximum number of conformers
+        for rotations, points, final_points in self._rotations_and_points():
+            n_confs = len(self.conformers)
 
-        for _ in iterprod(range(Config.num_complex_random_rotations), repeat=n-1):
-            # Generate the rotation thetas and axes
-            rotations = [np.random.uniform(-np.pi, np.pi, size=4) for _ in range(n - 1)]
+            if n_confs == Config.max_num_complex_conformers:
+                break
 
-            for points in iterprod(points_on_sphere, repeat=n-1):
+            final_points = final_points[:Config.max_num_complex_conformers - n_confs]
 
-                conf = Conformer(species=self, name=f'{self.name}_conf{m}')
-                conf.atoms = get_complex_conformer_atoms(self._molecules,
-                                                         rotations,
-                                                         points)
+            for atoms in get_complex_conformers_atoms(self._molecules,
+                                                      rotations,
+                                                      points,
+                                                      final_points):
+                conf = Conformer(species=self,
+                                 name=f'{self.name}_conf{len(self.conformers)}')
+                conf.atoms = atoms
                 self.conformers.append(conf)
-                m += 1
 
-                if m == Config.max_num_complex_conformers:
-                    logger.warning(f'Generated the maximum number of complex '
-                                   f'conformers ({m})')
-                    return None
+        if len(self.conformers) == Config.max_num_complex_conformers:
+            logger.warning(f'Generated the maximum number of complex '
+                           f'conformers ({len(self.conformers)})')
 
-        logger.info(f'Generated {m} conformers')
+        logger.info(f'Generated {len(self.conformers)} conformers')
         return None
 
+    def _rotations_and_points(self):
+        """
+        Generate the random rotations and points on a sphere from which the
+        rigid body conformers of this complex are built. The rotations are the
+        same for all points, for each of the num_complex_random_rotations, and
+        the final molecule is added at every point on the sphere
+
+        Yields:
+            (tuple(list(np.ndarray), tuple(np.ndarray), np.ndarray)): Rotations,
+                  points for all but the final molecule and the final points
+        """
+        n = self.n_molecules
+        points_on_sphere = np.array(get_points_on_sphere(n_points=Config.num_complex_sphere_points))
+
+        for _ in iterprod(range(Config.num_complex_random_rotations), repeat=n-1):
+            # Generate the rotation thetas and axes
+            rotations = [np.random.uniform(-np.pi, np.pi, size=4) for _ in range(n - 1)]
+
+            for points in iterprod(points_on_sphere, repeat=n-2):
+                yield rotations, points, points_on_sphere
+
     @work_in('conformers')
     def populate_conformers(self):
         """
@@ -229,8 +302,11 @@ class Complex(Species):
             raise ValueError(f'Could not translate molecule {mol_index} '
                              'not present in this complex')
 
-        for atom_idx in self.atom_indexes(mol_index):
-            self.atoms[atom_idx].translate(vec)
+        idxs = self.atom_indexes(mol_index)
+        coords = np.array([self.atoms[i].coord for i in idxs]) + np.asarray(vec)
+
+        for i, coord in zip(idxs, coords):
+            self.atoms[i].coord = coord
 
         return None
 
@@ -261,8 +337,17 @@ class Complex(Species):
             raise ValueError(f'Could not rotate molecule {mol_index} '
                              'not present in this complex')
 
-        for atom_idx in self.atom_indexes(mol_index):
-            self.atoms[atom_idx].rotate(axis, theta, origin)
+        # NOTE: Requires copy as the origin may be one of the coordinates
+        origin = np.zeros(3) if origin is None else np.array(origin, copy=True)
+        rot_matrix = get_rot_mat_euler(axis=axis, theta=theta)
+
+        # Rotate all the atoms in this molecule with a single matrix product
+        idxs = self.atom_indexes(mol_index)
+        coords = np.array([self.atoms[i].coord for i in idxs]) - origin
+        coords = np.dot(coords, rot_matrix.T) + origin
+
+        for i, coord in zip(idxs, coords):
+            self.atoms[i].coord = coord
 
         return None
 
@@ -271,16 +356,21 @@ class Complex(Species):
         """Calculate the repulsion between a molecule and the rest of the
         complex"""
 
-        coords = self.coordinates
+        coords = np.array(self.coordinates, dtype='f8')
+
+        is_mol_atom = np.zeros(self.n_atoms, dtype=bool)
+        is_mol_atom[self.atom_indexes(mol_index)] = True
 
-        mol_indexes = self.atom_indexes(mol_index)
-        mol_coords = [coords[i] for i in mol_indexes]
-        other_coords = [coords[i] for i in range(self.n_atoms)
-                        if i not in mol_indexes]
+        mol_coords = coords[is_mol_atom]
+        other_coords = coords[~is_mol_atom]
 
-        # Repulsion is the sum over all pairs 1/r^4
-        distance_mat = distance_matrix(mol_coords, other_coords)
-        repulsion = 0.5 * np.sum(np.power(distance_mat, -4))
+        # Repulsion is the sum over all pairs 1/r^4 = 1/(r^2)^2, which is
+        # infinite for any coincident atoms
+        sq_distance_mat = pairwise_sqeuclidean(mol_coords, other_coords)
+
+        with np.errstate(divide='ignore'):
+            repulsion = 0.5 * np.sum(np.reciprocal(sq_distance_mat
+                                                   * sq_distance_mat))
 
         return repulsion
 
@@ -300,6 +390,17 @@ class Complex(Species):
                                mol_index=i)
         return None
 
+    @staticmethod
+    def _init_atoms(molecule: Species, copy_atoms: bool) -> Optional[Atoms]:
+        """Initial atoms of a molecule in this complex, which if copied only
+        require new coordinates"""
+
+        if not copy_atoms or molecule.atoms is None:
+            return molecule.atoms
+
+        return atoms_with_coordinates(atoms=molecule.atoms,
+                                      coordinates=np.array(molecule.coordinates))
+
     def _init_solvent(self, solvent_name: str):
         """Initial solvent"""
 
@@ -341,13 +442,16 @@ class Complex(Species):
                                        molecules
         """
         super().__init__(name=name,
-                         atoms=sum((deepcopy(mol.atoms) if copy else mol.atoms
+                         atoms=sum((self._init_atoms(mol, copy_atoms=copy)
                                     for mol in args), None),
                          charge=sum(mol.charge for mol in args),
                          mult=sum(m.mult for m in args) - (len(args) - 1))
 
         self._molecules = args
 
+        # Index of the first atom in each molecule, then the total n_atoms
+        self._mol_offsets = np.cumsum([0] + [mol.n_atoms for mol in args])
+
         if do_init_translation:
             self._init_translation()
 
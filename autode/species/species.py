@@ -1,11 +1,11 @@
 import numpy as np
 import autode.values as val
-from copy import deepcopy
+from copy import copy, deepcopy
 from datetime import date
 from typing import Optional, Union, List, Sequence
 from scipy.spatial import distance_matrix
 from autode.log import logger
-from autode.atoms import Atom, Atoms, AtomCollection
+from autode.atoms import Atom, Atoms, AtomCollection, atoms_with_coordinates
 from autode.exceptions import CalculationException
 from autode.geom import calc_rmsd, get_rot_mat_euler
 from autode.constraints import Constraints
@@ -63,6 +63,24 @@ class Species(AtomCollection):
         """Copy this whole species"""
         return deepcopy(self)
 
+    def shallow_copy(self) -> 'Species':
+        """
+        Copy this species, copying only the atoms. All other attributes e.g.
+        the graph, solvent and energies are shared with this species, so only
+        the atoms of the copy should be modified
+
+        Returns:
+            (autode.species.Species):
+        """
+        species = copy(self)
+
+        if self.atoms is not None:
+            # Set directly, as the atoms setter would clear the energies etc.
+            # that are shared with this species
+            species._atoms = atoms_with_coordinates(self.atoms,
+                                                    self.coordinates)
+        return species
+
     def new_species(self, name='species') -> 'Species':
         """
         A new version of this species, identical properties without any
@@ -1,4 +1,3 @@
-from copy import deepcopy
 import numpy as np
 from numpy.linalg import norm as length
 from autode.atoms import DummyAtom
@@ -259,7 +258,9 @@ def get_cost_rotate_translate(x, reactant, subst_centres, attacking_mol_idx):
         (float):
     """
 
-    moved_reactant = deepcopy(reactant)
+    # Only the atoms are modified, so don't deep copy the whole reactant for
+    # every evaluation of the cost function
+    moved_reactant = reactant.shallow_copy()
     moved_reactant.rotate_mol(axis=x[:3], theta=x[3],
                               mol_index=attacking_mol_idx)
 
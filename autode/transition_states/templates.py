@@ -1,10 +1,13 @@
 import os
 import autode
+from collections import defaultdict
+from copy import copy
 from datetime import date
+from functools import lru_cache
 import networkx as nx
 from autode.config import Config
 from autode.log import logger
-from autode.mol_graphs import is_isomorphic
+from autode.mol_graphs import is_isomorphic, get_graph_hash
 from autode.exceptions import TemplateLoadingFailed
 from autode.solvent.solvents import get_solvent
 
@@ -46,15 +49,20 @@ def get_ts_template_folder_path(folder_path):
         return os.path.join(ts_dir_path, 'lib')
 
 
-def get_ts_templates(folder_path=None):
+def get_ts_templates(folder_path=None, graph=None):
     """Get all the transition state templates from a folder, or the default if
     folder path is None. Transition state templates should be .txt files with
     at least a charge, multiplicity, solvent, and a graph with some active
-    edge including distances.
+    edge including distances. Templates are cached until the files in the
+    folder change, so copies of the cached templates are returned
 
     Keyword Arguments:
         folder_path (str): e.g. '/path/to/the/ts/template/library'
 
+        graph (nx.Graph | None): If not None then only return the templates
+                                 that could be isomorphic to this graph i.e.
+                                 have the same graph hash
+
     Returns:
         (list(autode.transition_states.templates.TStemplate)): List of
         templates
@@ -66,15 +74,46 @@ def get_ts_templates(folder_path=None):
         logger.error('Folder does not exist')
         return []
 
-    templates = []
-
     # Attempt to form transition state templates for all the .txt files in the
-    # TS template folder
-    for filename in os.listdir(folder_path):
-
+    # TS template folder, reloading only if any have been modified. The size
+    # is included as modification times may be coarse on some filesystems
+    file_stamps = []
+    for filename in sorted(os.listdir(folder_path)):
         if not filename.endswith('.txt'):
             continue
 
+        stat = os.stat(os.path.join(folder_path, filename))
+        file_stamps.append((filename, stat.st_mtime_ns, stat.st_size))
+
+    templates, templates_by_hash = _load_ts_templates(folder_path,
+                                                      tuple(file_stamps))
+
+    if graph is not None:
+        templates = templates_by_hash.get(get_graph_hash(graph), ())
+
+    logger.info(f'Have {len(templates)} TS templates')
+    return [template.copy() for template in templates]
+
+
+@lru_cache(maxsize=8)
+def _load_ts_templates(folder_path, file_stamps):
+    """
+    Load the transition state templates from a set of files in a folder
+
+    Arguments:
+        folder_path (str):
+        file_stamps (tuple(tuple(str, int, int))): Filenames and their
+                                                   modification times and
+                                                   sizes
+
+    Returns:
+        (tuple(tuple(TStemplate), dict)): Templates and the templates keyed
+                                          by their graph hash
+    """
+    templates = []
+
+    for filename, _, _ in file_stamps:
+
         try:
             template = TStemplate(filename=os.path.join(folder_path, filename))
             templates.append(template)
@@ -82,8 +121,12 @@ def get_ts_templates(folder_path=None):
         except TemplateLoadingFailed:
             logger.warning(f'Failed to load a template for {filename}')
 
-    logger.info(f'Have {len(templates)} TS templates')
-    return templates
+    templates_by_hash = defaultdict(list)
+    for template in templates:
+        templates_by_hash[get_graph_hash(template.graph)].append(template)
+
+    return tuple(templates), {key: tuple(value)
+                              for key, value in templates_by_hash.items()}
 
 
 def template_matches(reactant, truncated_graph, ts_template):
@@ -306,6 +349,20 @@ class TStemplate:
 
         return None
 
+    def copy(self):
+        """
+        Copy this template, with its own graph. The solvent is shared
+
+        Returns:
+            (autode.transition_states.templates.TStemplate):
+        """
+        template = copy(self)
+
+        if self.graph is not None:
+            template.graph = self.graph.copy()
+
+        return template
+
     def graph_has_correct_structure(self):
         """Check that the graph has some active edges and distances"""
 
@@ -1,3 +1,4 @@
+import numpy as np
 from typing import Optional
 from autode.transition_states.base import TSbase
 from autode.transition_states.templates import get_ts_templates
@@ -27,7 +28,7 @@ def has_matching_ts_templates(reactant:   'autode.species.ReactantComplex',
 
     mol_graph = get_truncated_active_mol_graph(graph=reactant.graph,
                                                active_bonds=bond_rearr.all)
-    ts_guess_templates = get_ts_templates()
+    ts_guess_templates = get_ts_templates(graph=mol_graph)
 
     for ts_template in ts_guess_templates:
 
@@ -68,7 +69,12 @@ def get_template_ts_guess(reactant:   'autode.species.ReactantComplex',
     # This will add edges so don't modify in place
     mol_graph = get_truncated_active_mol_graph(graph=reactant.graph,
                                                active_bonds=bond_rearr.all)
-    ts_guess_templates = get_ts_templates()
+    ts_guess_templates = get_ts_templates(graph=mol_graph)
+
+    # Only the active bond distances are required from the coordinates
+    bonds = np.array(bond_rearr.all, dtype=int)
+    coords = np.asarray(reactant.coordinates)
+    dists = np.linalg.norm(coords[bonds[:, 0]] - coords[bonds[:, 1]], axis=1)
 
     for ts_template in ts_guess_templates:
 
@@ -85,19 +91,26 @@ def get_template_ts_guess(reactant:   'autode.species.ReactantComplex',
             i, j = active_bond
             logger.info(f'Mapping active bond {i}-{j}')
 
-            try:
-                dist = ts_template.graph.edges[mapping[i], mapping[j]]['distance']
+            mi, mj = mapping.get(i), mapping.get(j)
+            template_graph = ts_template.graph
+
+            if (mi is not None and mj is not None
+                    and template_graph.has_edge(mi, mj)
+                    and 'distance' in template_graph.edges[mi, mj]):
+                dist = template_graph.edges[mi, mj]['distance']
                 active_bonds_and_dists_ts[active_bond] = dist
 
-            except KeyError:
+            else:
                 logger.warning(f'Couldn\'t find a mapping for bond {i}-{j}')
 
         if len(active_bonds_and_dists_ts) != len(bond_rearr.all):
             continue
 
         logger.info('Found a TS guess from a template')
-        if any([abs(reactant.distance(*bond) - active_bonds_and_dists_ts[bond])
-                > dist_thresh for bond in bond_rearr.all]):
+        ts_dists = np.array([active_bonds_and_dists_ts[bond]
+                             for bond in bond_rearr.all])
+
+        if np.any(np.abs(dists - ts_dists) > dist_thresh):
             logger.info(f'TS template has => 1 active bond distance larger '
                         f'than {dist_thresh}. Passing')
             continue
@@ -7,12 +7,20 @@ from subprocess import Popen, DEVNULL, PIPE, STDOUT
 from tempfile import mkdtemp
 import multiprocessing as mp
 import multiprocessing.pool
+import numpy as np
+from scipy.spatial.distance import cdist
 from autode.log import logger
 from autode.exceptions import (NoAtomsInMolecule,
                                NoCalculationOutput,
                                NoConformers,
                                NoMolecularGraph)
 
+# Use SIMD accelerated distance matrices, if available
+try:
+    import simsimd
+except ImportError:
+    simsimd = None
+
 try:
     mp.set_start_method("fork")
 except RuntimeError:
@@ -183,6 +191,28 @@ def work_in_tmp_dir(filenames_to_copy, kept_file_exts, use_ll_tmp=False):
     return func_decorator
 
 
+def pairwise_sqeuclidean(coords_a, coords_b):
+    """
+    Squared Euclidean distance matrix between two sets of points, using
+    simsimd if it is installed and falling back to scipy's cdist if not
+
+    Arguments:
+        coords_a (np.ndarray): shape = (n, 3)
+        coords_b (np.ndarray): shape = (m, 3)
+
+    Returns:
+        (np.ndarray): shape = (n, m)
+    """
+    coords_a = np.ascontiguousarray(coords_a, dtype='f8')
+    coords_b = np.ascontiguousarray(coords_b, dtype='f8')
+
+    if simsimd is not None and len(coords_a) > 0 and len(coords_b) > 0:
+        return np.asarray(simsimd.cdist(coords_a, coords_b,
+                                        metric='sqeuclidean'), dtype='f8')
+
+    return cdist(coords_a, coords_b, 'sqeuclidean')
+
+
 def log_time(prefix='Executed in: ', units='ms'):
     """A function requiring a number of atoms to run"""
 
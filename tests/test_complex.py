@@ -1,7 +1,8 @@
-from autode.species.complex import Complex
+from autode.species.complex import (Complex, get_shift_distance,
+                                    get_complex_conformers_atoms)
 from autode.config import Config
 from autode.species.molecule import Molecule
-from autode.geom import are_coords_reasonable
+from autode.geom import are_coords_reasonable, get_points_on_sphere
 from autode.atoms import Atom
 from autode.values import Distance
 import numpy as np
@@ -117,6 +118,15 @@ def test_rotation():
 
     assert np.sum(expected_coords - dimer_copy.coordinates[[0, 1], :]) < 1E-9
 
+    # Rotating about a different origin should only move the second molecule
+    dimer_copy.rotate_mol(axis=[0.0, 0.0, 1.0], theta=np.pi,
+                          origin=[1.0, 0.0, 0.0], mol_index=1)
+
+    assert np.allclose(dimer_copy.coordinates, [[0.0, 0.0, 0.0],
+                                                [0.0, 0.0, -1.0],
+                                                [2.0, 0.0, 0.0],
+                                                [2.0, 0.0, 1.0]])
+
 
 def test_graph():
 
@@ -171,6 +181,78 @@ def test_conformer_generation2():
     dimer._generate_conformers()
     assert len(dimer.conformers) == 6 * 2
 
+    # Number of conformers is capped at the maximum
+    Config.max_num_complex_conformers = 8
+
+    dimer._generate_conformers()
+    assert len(dimer.conformers) == 8
+
+    Config.max_num_complex_conformers = 10000
+
+
+def test_conformer_generation_min_distance():
+
+    Config.num_complex_random_rotations = 1
+    Config.num_complex_sphere_points = 10
+    Config.max_num_complex_conformers = 10000
+
+    dimer._generate_conformers()
+
+    for conf in dimer.conformers:
+        coords = conf.coordinates
+        inter_dists = [np.linalg.norm(coords[i] - coords[j])
+                       for i in (0, 1) for j in (2, 3)]
+
+        # Second molecule should be shifted to be 2 Å from the first
+        assert np.isclose(min(inter_dists), 2.0, atol=1E-6)
+
+    # Conformers should have their own atoms, so modifying them does not
+    # modify the constituent molecules
+    dimer.conformers[0].atoms[0].translate(1.0, 0.0, 0.0)
+    assert np.allclose(hydrogen.coordinates, [[0.0, 0.0, 0.0],
+                                              [0.0, 0.0, 1.0]])
+
+
+def test_complex_conformers_share_rotation():
+
+    water = Molecule(name='water',
+                     atoms=[Atom('O'), Atom('H', x=-1), Atom('H', x=1)])
+    rotations = [np.array([1.0, 0.0, 0.0, 1.0])]
+    final_points = np.array(get_points_on_sphere(n_points=6))
+
+    confs_atoms = get_complex_conformers_atoms([water, water], rotations,
+                                               points=[],
+                                               final_points=final_points)
+    assert len(confs_atoms) == 6
+
+    # The rest of the complex is randomly rotated once per set of final
+    # points, so the first molecule has the same geometry in all of them
+    first_mol_coords = [atoms.coordinates[:3] for atoms in confs_atoms]
+    for coords in first_mol_coords[1:]:
+        assert np.allclose(coords, first_mol_coords[0])
+
+    # while the final molecule is added at a different point in each
+    assert not np.allclose(confs_atoms[0].coordinates[3:],
+                           confs_atoms[1].coordinates[3:])
+
+    # Different sets have different random rotations
+    Config.num_complex_random_rotations = 2
+    Config.num_complex_sphere_points = 6
+    Config.max_num_complex_conformers = 10000
+
+    h2o_dimer = Complex(water, water)
+    h2o_dimer._generate_conformers()
+    assert len(h2o_dimer.conformers) == 12
+
+    set_a, set_b = h2o_dimer.conformers[:6], h2o_dimer.conformers[6:]
+    for conformers in (set_a, set_b):
+        for conf in conformers[1:]:
+            assert np.allclose(conf.coordinates[:3],
+                               conformers[0].coordinates[:3])
+
+    assert not np.allclose(set_a[0].coordinates[:3],
+                           set_b[0].coordinates[:3])
+
 
 def test_complex_init():
 
@@ -207,8 +289,61 @@ def test_complex_atom_reorder():
     with pytest.raises(Exception):
         _ = hf_dimer.atom_indexes(2)  # molecules are indexed from 0
 
+    assert list(hf_dimer.atom_indexes(0)) == [0, 1]
+    assert list(hf_dimer.atom_indexes(1)) == [2, 3]
+
     assert [atom.label for atom in hf_dimer.atoms] == ['H', 'F', 'H', 'F']
 
     hf_dimer.reorder_atoms(mapping={0: 1, 1: 0, 2: 2, 3: 3})
     assert [atom.label for atom in hf_dimer.atoms] == ['F', 'H', 'H', 'F']
     assert hf_dimer.n_molecules == 2
+
+
+def test_complex_repulsion():
+
+    h2o = Molecule(name='water',
+                   atoms=[Atom('O'), Atom('H', x=-1), Atom('H', x=1)])
+    h2o_dimer = Complex(h2o, h2o)
+    h2o_dimer.translate_mol([0.0, 0.0, 2.0], mol_index=1)
+
+    # Intermolecular pairs are 2 Å, √5 Å or √8 Å apart, so the sum over all
+    # pairs is 3 x 1/2^4 + 4 x 1/√5^4 + 2 x 1/√8^4
+    expected = 0.5 * (3.0 / 16.0 + 4.0 / 25.0 + 2.0 / 64.0)
+    assert np.isclose(h2o_dimer.calc_repulsion(mol_index=0), expected)
+    assert np.isclose(h2o_dimer.calc_repulsion(mol_index=1), expected)
+
+    # and further apart should be less repulsive
+    h2o_dimer.translate_mol([0.0, 0.0, 2.0], mol_index=1)
+    assert h2o_dimer.calc_repulsion(mol_index=0) < expected
+
+    # Coincident atoms are infinitely repulsive
+    h2o_dimer.translate_mol([0.0, 0.0, -4.0], mol_index=1)
+    assert h2o_dimer.calc_repulsion(mol_index=0) == np.inf
+
+
+def test_shift_distance():
+
+    origin = np.zeros(shape=(1, 3))
+    x = np.array([1.0, 0.0, 0.0])
+
+    # Overlapping atoms need to be shifted by the full minimum distance
+    assert np.isclose(get_shift_distance(origin, origin, direction=x), 2.0)
+    assert np.isclose(get_shift_distance(origin, origin, direction=x,
+                                         min_dist=3.0), 3.0)
+
+    # An atom already far enough along the direction doesn't need shifting
+    assert get_shift_distance(origin, np.array([[5.0, 0.0, 0.0]]),
+                              direction=x) == 0.0
+
+    # nor does one which will never be within 2 Å
+    assert get_shift_distance(origin, np.array([[0.0, 3.0, 0.0]]),
+                              direction=x) == 0.0
+
+    # Only need to shift 1 Å if 1 Å away along the direction
+    assert np.isclose(get_shift_distance(origin, np.array([[1.0, 0.0, 0.0]]),
+                                         direction=x), 1.0)
+
+    # Multiple directions can be evaluated at once
+    shifts = get_shift_distance(origin, np.array([[1.0, 0.0, 0.0]]),
+                                direction=np.array([x, -x]))
+    assert np.allclose(shifts, [1.0, 3.0])
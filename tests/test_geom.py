@@ -48,6 +48,14 @@ def test_points_on_sphere():
     assert len(points) == 3
     assert np.abs(np.linalg.norm(points[0] - points[1]) - np.sqrt(3)) < 1E-6
 
+    # Points are cached, so repeated calls should give the same points which
+    # cannot be modified in place
+    assert all(np.allclose(p1, p2) for p1, p2
+               in zip(points, geom.get_points_on_sphere(n_points=2)))
+
+    with pytest.raises(ValueError):
+        points[0] += 1.0
+
 
 def test_calc_rmsd():
 
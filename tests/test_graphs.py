@@ -73,6 +73,20 @@ def test_isomorphic_graphs():
     assert mol_graphs.is_isomorphic(h2.graph, h2_alt.graph) is True
 
 
+def test_graph_hash():
+    h2_alt = Species(name='H2', atoms=[h_b, h_a], charge=0, mult=1)
+    mol_graphs.make_graph(h2_alt)
+
+    # Isomorphic graphs have the same hash
+    assert (mol_graphs.get_graph_hash(h2.graph)
+            == mol_graphs.get_graph_hash(h2_alt.graph))
+
+    # but not if an edge is active
+    h2_alt.graph.edges[0, 1]['active'] = True
+    assert (mol_graphs.get_graph_hash(h2.graph)
+            != mol_graphs.get_graph_hash(h2_alt.graph))
+
+
 def test_subgraph_isomorphism():
 
     h_c = Atom(atomic_symbol='H', x=0.0, y=0.0, z=1.4)
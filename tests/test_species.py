@@ -294,6 +294,24 @@ def test_species_copy():
     assert np.linalg.norm(species.atoms[0].coord - atom.coord) > 1
 
 
+def test_species_shallow_copy():
+
+    species = Species(name='h', charge=0, mult=2, atoms=[Atom('H')])
+    species.energy = -0.5
+
+    species_copy = species.shallow_copy()
+    species_copy.atoms[0].translate(vec=np.array([1.0, 1.0, 1.0]))
+
+    # Only the atoms are copied, so translating them doesn't move the
+    # original species or reset the shared energies
+    assert np.allclose(species.coordinates, [[0.0, 0.0, 0.0]])
+    assert species.energy is not None
+    assert species_copy.energies is species.energies
+
+    assert Species(name='tmp', charge=0, mult=1,
+                   atoms=None).shallow_copy().atoms is None
+
+
 def test_species_formula():
 
     assert mol.formula == 'H2'
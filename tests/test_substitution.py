@@ -1,10 +1,12 @@
 import os
+import numpy as np
 from autode.species.molecule import Reactant
 from autode.species.complex import ReactantComplex
 from autode.atoms import Atom
 from autode.bond_rearrangement import BondRearrangement
 from autode.substitution import (get_substc_and_add_dummy_atoms,
                                  attack_cost,
+                                 get_cost_rotate_translate,
                                  SubstitutionCentre)
 
 here = os.path.dirname(os.path.abspath(__file__))
@@ -67,3 +69,27 @@ def test_attack_cost():
     # The cost function should be larger for the randomly located reaction
     # complex compared to the ideal
     assert cost >= ideal_attack_cost
+
+
+def test_cost_rotate_translate():
+
+    subst_centers = get_substc_and_add_dummy_atoms(reactant=reac_complex,
+                                                   bond_rearrangement=bond_rearr,
+                                                   shift_factor=2)
+    init_coords = reac_complex.coordinates
+
+    x = np.array([1.0, 0.0, 0.0, 1.0, -1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.5])
+    cost = get_cost_rotate_translate(x, reac_complex, subst_centers,
+                                     attacking_mol_idx=0)
+    assert cost > 0
+
+    # Evaluating the cost should not move any atoms in the reactant
+    assert np.allclose(reac_complex.coordinates, init_coords)
+
+    # and no rotation/translation should be the same as the attack cost
+    x = np.array([1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0])
+    assert np.isclose(get_cost_rotate_translate(x, reac_complex,
+                                                subst_centers,
+                                                attacking_mol_idx=0),
+                      attack_cost(reac_complex, subst_centers,
+                                  attacking_mol_idx=0))
@@ -17,6 +17,7 @@ from autode.mol_graphs import get_truncated_active_mol_graph
 from autode.transition_states.ts_guess import get_template_ts_guess
 from autode.input_output import xyz_file_to_atoms
 from autode.wrappers.XTB import XTB
+from autode.utils import work_in_tmp_dir
 here = os.path.dirname(os.path.abspath(__file__))
 
 
@@ -102,6 +103,10 @@ def test_ts_template():
     assert len(templates) == 1
     assert templates[0].graph.number_of_nodes() == 6
 
+    # Templates can be filtered on a graph, to only those which could match
+    assert len(get_ts_templates(graph=templates[0].graph)) == 1
+    assert len(get_ts_templates(graph=ch3f.graph)) == 0
+
     tsg_template = get_template_ts_guess(reac_shift, product_complex,
                                          name='template',
                                          bond_rearr=bond_rearr,
@@ -170,6 +175,43 @@ def test_ts_templates_find():
     os.remove('wrong_template.txt')
 
 
+@work_in_tmp_dir(filenames_to_copy=[], kept_file_exts=[])
+def test_ts_templates_cache():
+
+    ts_graph = reac_complex.graph.copy()
+    ts_graph.add_edge(0, 2, active=True)
+    ts_graph.remove_edge(1, 2)
+    ts_graph.add_edge(1, 2, active=True)
+
+    truncated_graph = get_truncated_active_mol_graph(ts_graph)
+    truncated_graph.edges[(0, 2)]['distance'] = 1.9
+    truncated_graph.edges[(1, 2)]['distance'] = 2.0
+
+    template = TStemplate(truncated_graph, species=reac_complex)
+    template.save(folder_path=os.getcwd())
+
+    templates = get_ts_templates(folder_path=os.getcwd())
+    assert len(templates) == 1 and templates[0].charge == -1
+
+    # Modifying a returned template should not modify the cached one
+    templates[0].charge = 0
+    templates[0].graph.edges[0, 2]['distance'] = 3.0
+
+    template = get_ts_templates(folder_path=os.getcwd())[0]
+    assert template.charge == -1
+    assert template.graph.edges[0, 2]['distance'] == 1.9
+
+    # Re-saving a template with a different size but the same modification
+    # time should still reload it
+    mtime_ns = os.stat('template0.txt').st_mtime_ns
+    template.charge = -10
+    with open('template0.txt', 'w') as template_file:
+        template._save_to_file(template_file)
+
+    os.utime('template0.txt', ns=(mtime_ns, mtime_ns))
+    assert get_ts_templates(folder_path=os.getcwd())[0].charge == -10
+
+
 def test_inactive_graph():
 
     # Should fail to get a active graph from a graph with no active edges
@@ -10,6 +10,7 @@ from autode.utils import work_in_tmp_dir
 from autode.mol_graphs import is_isomorphic
 from subprocess import Popen, TimeoutExpired
 import multiprocessing as mp
+import numpy as np
 import time
 import pytest
 import os
@@ -204,3 +205,54 @@ def test_spawn_multiprocessing_graph():
     assert is_isomorphic(h2o_a.graph, h2o_b.graph)
 
     mp.set_start_method('fork', force=True)
+
+
+def test_pairwise_sqeuclidean():
+
+    coords_a = np.array([[0.0, 0.0, 0.0],
+                         [1.0, 0.0, 0.0]])
+    coords_b = np.array([[0.0, 2.0, 0.0]])
+
+    sq_dists = utils.pairwise_sqeuclidean(coords_a, coords_b)
+    assert sq_dists.shape == (2, 1)
+    assert np.allclose(sq_dists, [[4.0], [5.0]])
+
+    # Empty sets of points have an empty distance matrix
+    assert utils.pairwise_sqeuclidean(coords_a, np.zeros((0, 3))).shape == (2, 0)
+
+
+def test_pairwise_sqeuclidean_simsimd(monkeypatch):
+
+    class SimSIMDStub:
+
+        def __init__(self):
+            self.n_calls = 0
+
+        def cdist(self, coords_a, coords_b, metric):
+            assert metric == 'sqeuclidean'
+            assert coords_a.flags.c_contiguous and coords_b.flags.c_contiguous
+            self.n_calls += 1
+
+            # simsimd returns a tensor of single precision distances
+            diffs = coords_a[:, None, :] - coords_b[None, :, :]
+            return np.sum(diffs**2, axis=2).astype('f4').tolist()
+
+    stub = SimSIMDStub()
+    monkeypatch.setattr(utils, 'simsimd', stub)
+
+    coords_a = np.array([[0.0, 0.0, 0.0],
+                         [1.0, 0.0, 0.0]])
+    coords_b = np.array([[0.0, 2.0, 0.0]])
+
+    sq_dists = utils.pairwise_sqeuclidean(coords_a, coords_b)
+    assert stub.n_calls == 1
+
+    # Result should be converted to a double precision (n, m) array
+    assert isinstance(sq_dists, np.ndarray)
+    assert sq_dists.dtype == np.float64
+    assert sq_dists.shape == (2, 1)
+    assert np.allclose(sq_dists, [[4.0], [5.0]])
+
+    # Empty sets of points don't use simsimd
+    assert utils.pairwise_sqeuclidean(coords_a, np.zeros((0, 3))).shape == (2, 0)
+    assert stub.n_calls == 1